@@ -36,7 +36,10 @@ def main():
         token.write(creds.to_json())
 
     try:
-        service = build("calendar", "v3", credentials=creds)
+        service = build(
+            "calendar", "v3", credentials=creds,
+            cache_discovery=False, static_discovery=True
+        )
 
         # Call the Calendar API
         now = datetime.datetime.now().isoformat() + "Z"  # 'Z' indicates UTC time
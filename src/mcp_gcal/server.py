@@ -1,15 +1,33 @@
 from mcp.server.fastmcp import FastMCP
+import asyncio
+import cachetools
 import requests
 import urllib.parse
+import collections
+import contextlib
 import datetime
+import functools
+import itertools
+import logging
 import os
+import sys
+import threading
 import zoneinfo
 
-from google.auth.transport.requests import Request
+import httplib2
+from google.auth.transport.requests import AuthorizedSession, Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Update the instructions for your MCP server
 instructions = """
@@ -19,51 +37,377 @@ This is the instruction / prompt for your MCP server. Include instructions on wh
 # Create an MCP server
 mcp = FastMCP("mcp_gcal", instructions=instructions)
 
+# FastMCP sends log records to stderr, stdout is reserved for the stdio transport
+logger = logging.getLogger(__name__)
+
+# If modifying these scopes, delete the token file.
+_SCOPES = ("https://www.googleapis.com/auth/calendar.readonly",)
+# Fail at startup rather than on the first tool call if the paths are missing
+try:
+    _GCAL_TOKEN_PATH = os.environ['GCAL_TOKEN_PATH']
+    _GCAL_CREDENTIALS_PATH = os.environ['GCAL_CREDENTIALS_PATH']
+    # GCAL_TOKEN_PATH = "/Users/salinas/.config/goose/mcp-gcal/token.json"
+    # GCAL_CREDENTIALS_PATH="/Users/salinas/.config/goose/mcp-gcal/credentials.json"
+except KeyError as error:
+    raise KeyError(f"Can't find enviroment variable {error}") from error
+
+# Shared session for the registry API, keeps TLS connections alive between lookups
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    # Hand back the last 5xx response once retries run out, so its status code is reported
+    max_retries=Retry(
+        total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    ),
+))
+_SESSION.headers.update({"Accept-Encoding": "gzip"})
+
+# Set MCP_GCAL_DISABLE_CACHE=1 to always hit the registry and Calendar APIs
+_CACHE_DISABLED = os.environ.get("MCP_GCAL_DISABLE_CACHE") == "1"
+
+# Calendar timezones rarely change, keep them for an hour
+TIMEZONE_CACHE_TTL = 3600
+TIMEZONE_CACHE_MAXSIZE = 256
+_TIMEZONE_CACHE = cachetools.TTLCache(
+    maxsize=TIMEZONE_CACHE_MAXSIZE, ttl=TIMEZONE_CACHE_TTL
+)
+
+# Credentials and the Calendar service are built once and reused across tool
+# calls. The lock is re-entrant because _get_service() loads the credentials.
+_CACHE_LOCK = threading.RLock()
+_CREDS_CACHE = None
+_SERVICE_CACHE = None
+_SERVICE_CREDS = None
+
+# The token is refreshed in the background this many seconds before it
+# expires, so tool calls don't pay for the refresh. Set the event to stop it.
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_REFRESH_MIN_DELAY = 60
+_REFRESH_STOP = threading.Event()
+_REFRESH_THREAD = None
+
+# Seconds to wait on a Calendar API connection before giving up
+HTTP_TIMEOUT = 10
+
+# Partial response masks, only the fields below are returned by the API.
+# Events only request what _compact_event() keeps, plus the paging token.
+EVENT_FIELDS = "items(summary,start,end,location,attendees/email),nextPageToken"
+FREEBUSY_FIELDS = "calendars,groups"
+TIMEZONE_FIELDS = "id,summary,timeZone"
+
+_UTC = datetime.timezone.utc
+
+# Time zones loaded at import time
+COMMON_TIMEZONES = (
+    "UTC", "America/Los_Angeles", "America/New_York", "Europe/London", "Asia/Tokyo"
+)
+
+# Maximum number of events requested per page
+EVENTS_PAGE_MAX = 250
+
+# Google rejects batch requests with more than 50 calls
+BATCH_MAX_SIZE = 50
+# Maximum number of calendars a single free/busy query can ask for
+FREEBUSY_MAX_ITEMS = 50
+# Static part of every free/busy query, and the items of the default query
+_FB_TEMPLATE = {"groupExpansionMax": 2, "calendarExpansionMax": 2}
+_PRIMARY_ITEMS = [{"id": "primary"}]
+
+
+def _save_token(creds):
+    """
+    Writes the user's access and refresh tokens to GCAL_TOKEN_PATH
+
+    Args:
+        creds: Google API OAUTH2 Credentials
+    """
+    with open(_GCAL_TOKEN_PATH, "w") as token:
+        token.write(creds.to_json())
+
 
 def get_gcal_credentials():
     """
     Looks for credentials and generate a valid token
+
+    The credentials are cached after the first call and only refreshed once
+    they expire.
     
     Taken from https://github.com/googleworkspace/python-samples/blob/main/calendar/quickstart/quickstart.py
     
     Returns:
         creds: Google API OAUTH2 Credentials
     """
-    creds = None
-    GCAL_TOKEN_PATH = None
-    GCAL_CREDENTIALS_PATH = None
-    SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
-    try:
-        GCAL_TOKEN_PATH = os.environ['GCAL_TOKEN_PATH']
-        GCAL_CREDENTIALS_PATH = os.environ['GCAL_CREDENTIALS_PATH']
-        # GCAL_TOKEN_PATH = "/Users/salinas/.config/goose/mcp-gcal/token.json"
-        # GCAL_CREDENTIALS_PATH="/Users/salinas/.config/goose/mcp-gcal/credentials.json"
-    except KeyError as error:
-        raise KeyError(f"Can't find enviroment variable {error}") from error
-    except Exception as error:
-        raise error
-    
-    # The file token.json stores the user's access and refresh tokens, and is
-    # created automatically when the authorization flow completes for the first
-    # time.
-    if os.path.exists(GCAL_TOKEN_PATH):
-        creds = Credentials.from_authorized_user_file(GCAL_TOKEN_PATH, SCOPES)
-    # If there are no (valid) credentials available, let the user log in.
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            # Needs credentials.json to generate the token
-            # credentials.json is downloaded from the GCP project
-            flow = InstalledAppFlow.from_client_secrets_file(
-                GCAL_CREDENTIALS_PATH, SCOPES
+    global _CREDS_CACHE
+
+    with _CACHE_LOCK:
+        creds = _CREDS_CACHE
+        if creds and creds.valid:
+            return creds
+
+        # The file token.json stores the user's access and refresh tokens, and is
+        # created automatically when the authorization flow completes for the first
+        # time. It is only read when nothing is cached yet.
+        if not creds and os.path.exists(_GCAL_TOKEN_PATH):
+            creds = Credentials.from_authorized_user_file(_GCAL_TOKEN_PATH, _SCOPES)
+        # If there are no (valid) credentials available, let the user log in.
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                # Needs credentials.json to generate the token
+                # credentials.json is downloaded from the GCP project
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    _GCAL_CREDENTIALS_PATH, _SCOPES
+                )
+                # stdout carries the stdio JSON-RPC stream, keep the
+                # "Please visit this URL" prompt off it
+                with contextlib.redirect_stdout(sys.stderr):
+                    creds = flow.run_local_server(port=0)
+            # Save the new credentials for the next run
+            _save_token(creds)
+
+        _CREDS_CACHE = creds
+        _start_token_refresher()
+        return (creds)
+
+
+def _refresh_loop():
+    """
+    Refreshes the cached credentials shortly before they expire, until _REFRESH_STOP is set
+    """
+    while True:
+        creds = _CREDS_CACHE
+        delay = TOKEN_REFRESH_MIN_DELAY
+        if creds is not None and creds.expiry is not None:
+            # google-auth keeps expiry as a naive UTC datetime
+            now = datetime.datetime.now(_UTC).replace(tzinfo=None)
+            remaining = (creds.expiry - now).total_seconds()
+            delay = max(TOKEN_REFRESH_MIN_DELAY, remaining - TOKEN_REFRESH_MARGIN)
+        if _REFRESH_STOP.wait(delay):
+            return
+
+        with _CACHE_LOCK:
+            creds = _CREDS_CACHE
+            if creds is None or not creds.refresh_token:
+                continue
+            # Another caller may have refreshed the token since this wake-up was scheduled
+            if creds.expiry is not None:
+                now = datetime.datetime.now(_UTC).replace(tzinfo=None)
+                if (creds.expiry - now).total_seconds() > TOKEN_REFRESH_MARGIN:
+                    continue
+            try:
+                creds.refresh(Request())
+                _save_token(creds)
+            except Exception as error:
+                logger.warning("Background token refresh failed: %s", error)
+
+
+def _start_token_refresher():
+    """
+    Starts the background token refresh thread, once per process
+    """
+    global _REFRESH_THREAD
+
+    with _CACHE_LOCK:
+        if _REFRESH_THREAD is None:
+            _REFRESH_THREAD = threading.Thread(target=_refresh_loop, daemon=True)
+            _REFRESH_THREAD.start()
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes API responses with orjson"""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+class _RequestsHttp:
+    """
+    httplib2.Http stand-in that sends Calendar API calls through a pooled AuthorizedSession
+
+    googleapiclient only needs request() and the credentials attribute, so
+    regular and batch requests share one thread-safe urllib3 connection pool.
+    """
+
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self.session = AuthorizedSession(credentials)
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+    def request(self, uri, method="GET", body=None, headers=None,
+                redirections=None, connection_type=None):
+        response = self.session.request(
+            method, uri, data=body, headers=headers, timeout=HTTP_TIMEOUT
+        )
+        # requests already decompressed the body
+        info = {
+            key: value for key, value in response.headers.items()
+            if key.lower() != "content-encoding"
+        }
+        info["status"] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+
+# The Calendar service along with its pre-bound API methods, so tool calls
+# don't instantiate a new Resource for every request
+_CalendarApi = collections.namedtuple(
+    "_CalendarApi", ["service", "events_list", "freebusy_query", "calendars_get"]
+)
+
+
+def _get_service():
+    """
+    Returns a cached Google Calendar service, building it on first use
+
+    The service is rebuilt only when the cached credentials are replaced; an
+    in-place refresh of expired credentials keeps the same service usable.
+
+    Returns:
+        _CalendarApi: Google Calendar API v3 resource and its bound methods
+    """
+    global _SERVICE_CACHE, _SERVICE_CREDS
+
+    with _CACHE_LOCK:
+        creds = get_gcal_credentials()
+        if _SERVICE_CACHE is None or _SERVICE_CREDS is not creds:
+            service = build(
+                "calendar", "v3", http=_RequestsHttp(creds),
+                cache_discovery=False, static_discovery=True,
+                # orjson is optional, fall back to the default json model
+                model=_OrjsonModel() if orjson else None
             )
-            creds = flow.run_local_server(port=0)
-    # Save the credentials for the next run
-    with open("token.json", "w") as token:
-        token.write(creds.to_json())
-    
-    return (creds)
+            _SERVICE_CACHE = _CalendarApi(
+                service=service,
+                events_list=service.events().list,
+                freebusy_query=service.freebusy().query,
+                calendars_get=service.calendars().get,
+            )
+            _SERVICE_CREDS = creds
+        return _SERVICE_CACHE
+
+
+def _execute(request):
+    """
+    Executes an API request, meant to be run in a worker thread
+
+    Args:
+        request: Unexecuted Google API request
+
+    Returns:
+        dict: The API response
+    """
+    return request.execute()
+
+
+def _utc_now():
+    """
+    Returns the current time as an RFC 3339 UTC timestamp, e.g. 2024-01-01T09:00:00Z
+    """
+    return datetime.datetime.now(_UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _compact_event(event):
+    """
+    Projects a Calendar API event to the compact schema returned by the tools
+
+    Args:
+        event (dict): Event as returned by the API
+
+    Returns:
+        dict: The start (s), end (e), title (t), location (l) and up to 10 attendee emails (a)
+    """
+    start = event.get("start", {})
+    end = event.get("end", {})
+    return {
+        "s": start.get("dateTime") or start.get("date"),
+        "e": end.get("dateTime") or end.get("date"),
+        "t": event.get("summary", ""),
+        "l": event.get("location"),
+        "a": [a["email"] for a in event.get("attendees", []) if "email" in a][:10],
+    }
+
+
+def _chunked(iterable, size):
+    """
+    Splits an iterable into lists of at most size elements
+
+    Args:
+        iterable: Items to split
+        size (int): Maximum length of each chunk
+
+    Yields:
+        list: The next chunk of items
+    """
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _execute_batch(service, requests_by_id):
+    """
+    Dispatches requests through Google's batch endpoint, 50 calls per HTTP request
+
+    Args:
+        service: Google Calendar API v3 resource
+        requests_by_id (dict): Mapping of calendar id to an unexecuted API request
+
+    Returns:
+        dict: Mapping of calendar id to its response, or an error message
+    """
+    results = {}
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            results[request_id] = f"An error occurred: {exception}"
+        else:
+            results[request_id] = response
+
+    for chunk in _chunked(requests_by_id.items(), BATCH_MAX_SIZE):
+        batch = service.new_batch_http_request(callback=_collect)
+        for request_id, request in chunk:
+            batch.add(request, request_id=request_id)
+        batch.execute()
+
+    return results
+
+
+@functools.lru_cache(maxsize=512)
+def _tz(name):
+    """
+    Returns the ZoneInfo for an IANA time zone, memoized per name
+
+    Args:
+        name (str): A time zone from the IANA Database
+
+    Returns:
+        zoneinfo.ZoneInfo: The time zone
+    """
+    return zoneinfo.ZoneInfo(name)
+
+
+def _warm_timezones():
+    """
+    Loads the most common time zones so the first tool call doesn't read them from disk
+    """
+    for name in COMMON_TIMEZONES:
+        try:
+            _tz(name)
+        except zoneinfo.ZoneInfoNotFoundError:
+            pass
+
+
+_warm_timezones()
+
 
 @mcp.tool()
 def get_timezone_difference(tz1: str, tz2: str) -> dict:
@@ -76,11 +420,11 @@ def get_timezone_difference(tz1: str, tz2: str) -> dict:
     Returns:
         dict: A dictionary containing result status and 
     """
-    dt = datetime.datetime.now()
+    now = datetime.datetime.now(_UTC)
 
     try:
-        tz1_utc = dt.astimezone(zoneinfo.ZoneInfo(tz1)).utcoffset()
-        tz2_utc = dt.astimezone(zoneinfo.ZoneInfo(tz2)).utcoffset()
+        tz1_utc = now.astimezone(_tz(tz1)).utcoffset()
+        tz2_utc = now.astimezone(_tz(tz2)).utcoffset()
     except Exception as error:
         return {"result": f"An error occurred: {error}", "delta": None}
     
@@ -89,19 +433,39 @@ def get_timezone_difference(tz1: str, tz2: str) -> dict:
     return {"result": "success", "delta": tzdiff}
 
 
-# Tool to lookup email from registry
-@mcp.tool()
-def lookup_registry_email(name: str) -> str:
-    """Given a name, obtain the email of the individual from the registry API.
+class _RegistryError(Exception):
+    """Raised when the registry API can't be queried"""
+
+
+class _RegistryNotFound(Exception):
+    """Raised when the registry has no match for a query"""
+
+
+@cachetools.cached(
+    cache=cachetools.LRUCache(maxsize=1024),
+    key=lambda query: query.strip().lower(),
+    lock=threading.Lock(),
+)
+def _search_registry(query):
+    """
+    Searches the registry API, caching the email found for each query
+
+    The query is sent as given, only the cache key is normalized. Misses
+    raise instead of returning, so they aren't cached and a person added
+    to the registry later is found on the next lookup.
 
     Args:
-        name (str): name or approximate name of the person to search for
-    
+        query (str): Name of the person to search for
+
+    Raises:
+        _RegistryError: If the API returns a non 200 status code or a match without email
+        _RegistryNotFound: If there are no matches
+
     Returns:
-        str: The email address of the person, or an error message if not found
+        str: The email of the first match
     """
     # URL encode the query parameter
-    encoded_query = urllib.parse.quote(name)
+    encoded_query = urllib.parse.quote(query)
     url = f"https://registry.sqprod.co/api/v2/users/search?query={encoded_query}"
     
     # Set headers for the request
@@ -109,60 +473,134 @@ def lookup_registry_email(name: str) -> str:
         'accept': 'application/json'
     }
     
+    # Make the request to the registry API
+    response = _SESSION.get(url, headers=headers, timeout=(3.05, 10))
+    
+    # Check if the request was successful
+    if response.status_code != 200:
+        raise _RegistryError(f"Error: API returned status code {response.status_code}")
+
+    data = response.json()
+    
+    # Check if any results were returned
+    if not data or len(data) == 0:
+        raise _RegistryNotFound(query)
+
+    # Return the email of the first match
+    if "email" not in data[0]:
+        raise _RegistryError("Email not found in response")
+    return data[0]["email"]
+
+
+# Tool to lookup email from registry
+@mcp.tool()
+async def lookup_registry_email(name: str) -> str:
+    """Given a name, obtain the email of the individual from the registry API.
+
+    Args:
+        name (str): name or approximate name of the person to search for
+    
+    Returns:
+        str: The email address of the person, or an error message if not found
+    """
+    search = _search_registry.__wrapped__ if _CACHE_DISABLED else _search_registry
+
     try:
-        # Make the request to the registry API
-        response = requests.get(url, headers=headers)
-        
-        # Check if the request was successful
-        if response.status_code == 200:
-            data = response.json()
-            
-            # Check if any results were returned
-            if data and len(data) > 0:
-                # Return the email of the first match
-                return data[0].get("email", "Email not found in response")
-            else:
-                return f"No results found for '{name}'"
-        else:
-            return f"Error: API returned status code {response.status_code}"
+        return await asyncio.to_thread(search, name)
+    except _RegistryNotFound:
+        return f"No results found for '{name}'"
+    except _RegistryError as e:
+        return str(e)
     except Exception as e:
         return f"Error making request: {str(e)}"
 
 
 @mcp.tool()
-def retrieve_calendar_events(id: str="primary") -> dict:
-    """Given an email, retrieves the calendar events.
+async def retrieve_calendar_events(id: str="primary", max_results: int = 10) -> dict:
+    """Given an email, retrieves the upcoming calendar events.
 
     Args:
         id (str): Email address to retrieve calendar events for. Defaults to the user's calendar
+        max_results (int, optional): Maximum number of events to retrieve. Defaults to 10
         
     Returns:
-        result: Dict of call result and list of calendar events for the specified email
+        result: Dict of call result and list of calendar events for the specified email.
+        Each event has the keys s (start), e (end), t (title), l (location)
+        and a (up to 10 attendee emails)
     """
     events = []
     try:
-        creds = get_gcal_credentials()
+        api = await asyncio.to_thread(_get_service)
     except Exception as error:
         return {"result":f"An error occurred: {error}", "events":events}
     
     try:
-        service = build("calendar", "v3", credentials=creds)
+        # Call the Calendar API
+        now = _utc_now()
+        logger.debug("Fetching %d events from %s", max_results, id)
+        # Only fetch as many pages as needed to collect max_results events
+        page_token = None
+        while len(events) < max_results:
+            events_result = await asyncio.to_thread(
+                _execute,
+                api.events_list(
+                    calendarId=id,
+                    timeMin=now,
+                    maxResults=min(EVENTS_PAGE_MAX, max_results - len(events)),
+                    pageToken=page_token,
+                    singleEvents=True,
+                    orderBy="startTime",
+                    fields=EVENT_FIELDS,
+                )
+            )
+            events.extend(_compact_event(x) for x in events_result.get("items", []))
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
+
+    except Exception as error:
+        return {"result": f"An error occurred: {error}", "events": events}
+    
+    return {"result": "success", "events": events}
 
+
+@mcp.tool()
+async def retrieve_calendar_events_batch(ids: list) -> dict:
+    """Given a list of emails, retrieves the calendar events of each of them in a single request.
+
+    Args:
+        ids (list): Email addresses to retrieve calendar events for
+        
+    Returns:
+        result: Dict of call result and calendar events (or an error message) keyed by email.
+        Each event has the keys s (start), e (end), t (title), l (location)
+        and a (up to 10 attendee emails)
+    """
+    events = {}
+    try:
+        api = await asyncio.to_thread(_get_service)
+    except Exception as error:
+        return {"result": f"An error occurred: {error}", "events": events}
+    
+    try:
         # Call the Calendar API
-        now = datetime.datetime.now().isoformat() + "Z"  # 'Z' indicates UTC time
-        print("Getting the upcoming 10 events")
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
+        now = _utc_now()
+        requests_by_id = {
+            x: api.events_list(
+                calendarId=x,
                 timeMin=now,
                 maxResults=50,
                 singleEvents=True,
                 orderBy="startTime",
+                fields=EVENT_FIELDS,
             )
-            .execute()
-        )
-        events = events_result.get("items", [])
+            for x in ids
+        }
+        responses = await asyncio.to_thread(_execute_batch, api.service, requests_by_id)
+        events = {
+            x: [_compact_event(e) for e in r.get("items", [])] if isinstance(r, dict) else r
+            for x, r in responses.items()
+        }
 
     except Exception as error:
         return {"result": f"An error occurred: {error}", "events": events}
@@ -170,12 +608,31 @@ def retrieve_calendar_events(id: str="primary") -> dict:
     return {"result": "success", "events": events}
 
 
+def _merge_free_busy(responses):
+    """
+    Combines the responses of several free/busy queries into a single one
+
+    Args:
+        responses (list): Free/busy query responses
+
+    Returns:
+        dict: The first response, extended with the calendars and groups of the others
+    """
+    if not responses:
+        return {}
+    merged = responses[0]
+    for response in responses[1:]:
+        merged.setdefault("calendars", {}).update(response.get("calendars", {}))
+        merged.setdefault("groups", {}).update(response.get("groups", {}))
+    return merged
+
+
 @mcp.tool()
-def retrieve_calendar_free_busy_slots(
+async def retrieve_calendar_free_busy_slots(
         time_min: str,
         time_max: str,
         timezone: str = "UTC",
-        ids: list = ["primary"]) -> dict:
+        ids: tuple = ("primary",)) -> dict:
 
     """Retrieves free and busy slots from the calendars of the ids list. 
 
@@ -185,33 +642,51 @@ def retrieve_calendar_free_busy_slots(
         time_min (str): Starting time in isoformat
         time_max (str): Finish time in isoformat
         timezone (str, optional): The timezone of interest
-        ids (list, optional): A list containing emails for the 
+        ids (tuple, optional): A list containing emails for the 
         calendars of interest. Defaults to the user's calendar.
 
     Returns:
-        dict: A dictionary containing the free or busy slots for each of the ids requested
+        dict: A dictionary containing the free or busy slots for each of the ids requested.
+        Calendars that are free for the whole range have an empty busy list
     """    
     
+    # Drop duplicated ids, keeping their order, and skip the call if none are left
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        return {"result": "success", "response": {"calendars": {}}}
+
     try:
-        creds = get_gcal_credentials()
+        api = await asyncio.to_thread(_get_service)
     except Exception as error:
         return {"result": f"An error occurred: {error}", "response": {}}
     
-    items = [{"id": x} for x in ids]
-    query = {
-        "timeMin": time_min,
-        "timeMax": time_max,
-        "timeZone": timezone,
-        "groupExpansionMax": 2,
-        "calendarExpansionMax": 2,
-        "items": items
-    }
+    if ids == ["primary"]:
+        chunks = [_PRIMARY_ITEMS]
+    else:
+        chunks = [
+            [{"id": x} for x in chunk] for chunk in _chunked(ids, FREEBUSY_MAX_ITEMS)
+        ]
+    queries = [
+        {
+            **_FB_TEMPLATE,
+            "timeMin": time_min,
+            "timeMax": time_max,
+            "timeZone": timezone,
+            "items": items
+        }
+        for items in chunks
+    ]
     
     try:
-        service = build("calendar", "v3", credentials=creds)
-        
-        # Call the Calendar API
-        response = service.freebusy().query(body=query).execute()
+        # Call the Calendar API, one concurrent query per chunk of ids
+        responses = await asyncio.gather(*(
+            asyncio.to_thread(
+                _execute,
+                api.freebusy_query(body=query, fields=FREEBUSY_FIELDS)
+            )
+            for query in queries
+        ))
+        response = _merge_free_busy(responses)
         
     except Exception as error:
         return {"result": f"An error occurred: {error}", "response": {}}
@@ -220,7 +695,7 @@ def retrieve_calendar_free_busy_slots(
 
 
 @mcp.tool()
-def retrieve_timezone(calendar_id: str = "primary") -> dict:
+async def retrieve_timezone(calendar_id: str = "primary") -> dict:
     """Retrieves timezone for a given calendar.
     
     Args:
@@ -230,18 +705,75 @@ def retrieve_timezone(calendar_id: str = "primary") -> dict:
         dict: A dictionary containing the free or busy slots for each of the ids requested
     """ 
     
+    response = None if _CACHE_DISABLED else _TIMEZONE_CACHE.get(calendar_id)
+    if response is not None:
+        return {"result": "success", "response": response}
+
     try:
-        creds = get_gcal_credentials()
+        api = await asyncio.to_thread(_get_service)
     except Exception as error:
         return {"result": f"An error occurred: {error}", "response": {}}
     
     try:
-        service = build("calendar", "v3", credentials=creds)
+        # Call the Calendar API
+        response = await asyncio.to_thread(
+            _execute, api.calendars_get(
+                calendarId=calendar_id, fields=TIMEZONE_FIELDS
+            )
+        )
         
+    except Exception as error:
+        return {"result": f"An error occurred: {error}", "response": {}}
+    
+    if not _CACHE_DISABLED:
+        _TIMEZONE_CACHE[calendar_id] = response
+    return {"result": "success", "response": response}
+
+
+@mcp.tool()
+async def retrieve_timezones_batch(calendar_ids: list) -> dict:
+    """Retrieves the timezone of several calendars in a single request.
+    
+    Args:
+        calendar_ids (list): ids / emails of the calendars of interest
+
+    Returns:
+        dict: A dictionary containing the calendar (or an error message) keyed by each of the ids requested
+    """ 
+    
+    response = {}
+    if not _CACHE_DISABLED:
+        for x in calendar_ids:
+            cached = _TIMEZONE_CACHE.get(x)
+            if cached is not None:
+                response[x] = cached
+    misses = [x for x in calendar_ids if x not in response]
+    if not misses:
+        return {"result": "success", "response": response}
+
+    try:
+        api = await asyncio.to_thread(_get_service)
+    except Exception as error:
+        return {"result": f"An error occurred: {error}", "response": {}}
+    
+    try:
         # Call the Calendar API
-        response = service.calendars().get(calendarId=calendar_id).execute()
+        fetched = await asyncio.to_thread(
+            _execute_batch,
+            api.service,
+            {
+                x: api.calendars_get(calendarId=x, fields=TIMEZONE_FIELDS)
+                for x in misses
+            }
+        )
         
     except Exception as error:
         return {"result": f"An error occurred: {error}", "response": {}}
     
+    if not _CACHE_DISABLED:
+        # Failed calls come back as error strings, only cache the calendars
+        for x, calendar in fetched.items():
+            if isinstance(calendar, dict):
+                _TIMEZONE_CACHE[x] = calendar
+    response.update(fetched)
     return {"result": "success", "response": response}